@@ -0,0 +1,144 @@
+"""
+Tests for the chunking, condensing and caching paths in the summarizer.
+"""
+
+from typing import Iterator, Optional
+
+import pytest
+
+from youtube_summary import summarizer
+from youtube_summary.cache import FileBackend, LLMCache
+from youtube_summary.summarizer import (
+    LLMProvider,
+    _WORDS_PER_TOKEN,
+    _chunk_text,
+    _estimate_tokens,
+    _map_chunks,
+    _strip_stream,
+    summarize_text,
+)
+
+
+class StubProvider(LLMProvider):
+    """Provider returning a fixed-length summary and counting its calls."""
+
+    model_name = "stub"
+
+    def __init__(self, summary_words: int = 50):
+        self.summary_words = summary_words
+        self.calls = []
+
+    def summarize(self, text: str, max_length: Optional[int] = None) -> str:
+        return ''.join(self.stream(text, max_length)).strip()
+
+    def stream(self, text: str, max_length: Optional[int] = None) -> Iterator[str]:
+        self.calls.append(text)
+        yield "\n  "
+        for _ in range(self.summary_words):
+            yield "word "
+        yield "\n"
+
+
+def _words(count: int) -> str:
+    return ' '.join(f"w{i}" for i in range(count))
+
+
+@pytest.mark.parametrize("chunk_tokens", [1, 10, 100, 3000])
+def test_chunk_text_covers_every_word(chunk_tokens):
+    text = _words(5000)
+    chunks = _chunk_text(text, chunk_tokens=chunk_tokens)
+
+    chunk_words = max(1, int(chunk_tokens * _WORDS_PER_TOKEN))
+    assert all(len(chunk.split()) <= chunk_words for chunk in chunks)
+    assert set(' '.join(chunks).split()) == set(text.split())
+
+
+def test_chunk_text_short_text_is_one_chunk():
+    assert _chunk_text("a b c", chunk_tokens=100) == ["a b c"]
+
+
+def test_chunk_text_overlap_leaves_most_of_each_chunk_new():
+    chunks = _chunk_text(_words(5000), chunk_tokens=100)
+
+    # 75 words per chunk with at most 18 of them shared with the next
+    assert len(chunks) <= 5000 // (75 - 18) + 1
+
+
+def test_map_chunks_bounds_reduce_input(monkeypatch):
+    monkeypatch.setenv("SUMMARY_CHUNK_TOKENS", "3000")
+    provider = StubProvider(summary_words=400)
+
+    for words in (20_000, 40_000, 100_000):
+        reduce_input = _map_chunks(provider, _words(words))
+        assert _estimate_tokens(reduce_input) <= 3000
+
+
+def test_map_chunks_call_count_stays_linear(monkeypatch):
+    # Summaries nearly as long as a chunk must not make condensing loop forever
+    monkeypatch.setenv("SUMMARY_CHUNK_TOKENS", "1000")
+    provider = StubProvider(summary_words=600)
+
+    _map_chunks(provider, _words(30_000))
+
+    chunk_count = len(_chunk_text(_words(30_000), chunk_tokens=1000))
+    assert len(provider.calls) <= 3 * chunk_count
+
+
+def test_map_chunks_short_text_makes_no_calls(monkeypatch):
+    monkeypatch.setenv("SUMMARY_CHUNK_TOKENS", "3000")
+    provider = StubProvider()
+
+    assert _map_chunks(provider, "a short transcript") == "a short transcript"
+    assert provider.calls == []
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-5"])
+def test_invalid_chunk_tokens_is_rejected(monkeypatch, value):
+    monkeypatch.setenv("SUMMARY_CHUNK_TOKENS", value)
+
+    with pytest.raises(ValueError, match="SUMMARY_CHUNK_TOKENS"):
+        _map_chunks(StubProvider(), "text")
+
+
+def test_strip_stream_matches_summarize():
+    provider = StubProvider(summary_words=5)
+
+    assert ''.join(_strip_stream(provider.stream("text"))) == provider.summarize("text")
+
+
+@pytest.mark.parametrize("pieces", [[], ["  "], ["\n", " a", " ", "", "b  ", " "]])
+def test_strip_stream_matches_strip(pieces):
+    assert ''.join(_strip_stream(iter(pieces))) == ''.join(pieces).strip()
+
+
+@pytest.fixture
+def stub_provider(monkeypatch, tmp_path):
+    """Route summarize_text to a stub provider and a fresh file cache."""
+    provider = StubProvider(summary_words=5)
+    cache = LLMCache(FileBackend(str(tmp_path)))
+    monkeypatch.setattr(summarizer, "get_provider", lambda *args, **kwargs: provider)
+    monkeypatch.setattr(summarizer, "get_cache", lambda: cache)
+    monkeypatch.setenv("SUMMARY_CHUNK_TOKENS", "3000")
+    return provider
+
+
+@pytest.mark.parametrize("first_stream", [False, True])
+@pytest.mark.parametrize("second_stream", [False, True])
+def test_summarize_text_cache_miss_then_hit(stub_provider, first_stream, second_stream):
+    def run(stream):
+        result = summarize_text("a transcript", provider_name="ollama", stream=stream)
+        return ''.join(result) if stream else result
+
+    first = run(first_stream)
+    assert len(stub_provider.calls) == 1
+
+    second = run(second_stream)
+    assert len(stub_provider.calls) == 1
+    assert first == second == "word word word word word"
+
+
+def test_summarize_text_without_cache_calls_provider_each_time(stub_provider):
+    summarize_text("a transcript", provider_name="ollama", use_cache=False)
+    summarize_text("a transcript", provider_name="ollama", use_cache=False)
+
+    assert len(stub_provider.calls) == 2
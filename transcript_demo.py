@@ -1,3 +1,4 @@
+from operator import itemgetter
 from youtube_transcript_api import YouTubeTranscriptApi
 
 # Example video ID from the URL you provided
@@ -12,7 +13,7 @@ try:
         print(f"{line['start']}-{line['start'] + line['duration']}: {line['text']}")
     
     # Alternatively, get the transcript as a single string
-    transcript_text = ' '.join([line['text'] for line in transcript])
+    transcript_text = ' '.join(map(itemgetter('text'), transcript))
     print("\nFull transcript as a single string:")
     print(transcript_text)
     
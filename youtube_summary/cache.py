@@ -0,0 +1,300 @@
+"""
+Module for caching LLM responses so repeated summaries skip the provider call.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import time
+import warnings
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+
+# orjson is optional; the stdlib fallback uses the same compact, sorted,
+# non-ASCII-escaping layout so cache keys match with or without it
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+
+    _loads = json.loads
+
+
+class CacheBackend(ABC):
+    """Abstract base class for cache storage backends."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Optional time-to-live in seconds (None means no expiry)
+        """
+        pass
+
+
+class FileBackend(CacheBackend):
+    """Backend storing one JSON file per entry, evicting least recently used entries."""
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = 1000):
+        """
+        Initialize the file backend.
+
+        Args:
+            directory: Cache directory (defaults to ~/.cache/youtube_summary)
+            max_entries: Maximum number of entries kept before LRU eviction
+        """
+        self.directory = Path(directory or Path.home() / ".cache" / "youtube_summary").expanduser()
+        self.max_entries = max_entries
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < time.time():
+            path.unlink(missing_ok=True)
+            return None
+
+        # Bump the modification time so eviction treats this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry.get("value")
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Optional time-to-live in seconds (None means no expiry)
+        """
+        entry = {
+            "value": value,
+            "expires_at": time.time() + ttl if ttl else None,
+        }
+
+        # Write to a temporary file first so readers never see a partial entry
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(entry))
+        os.replace(tmp_path, path)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        entries = list(self.directory.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+
+class RedisBackend(CacheBackend):
+    """Backend storing entries in Redis (requires the redis package)."""
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "youtube_summary:"):
+        """
+        Initialize the Redis backend.
+
+        Args:
+            url: Redis connection URL (defaults to REDIS_URL environment variable)
+            prefix: Prefix applied to every key
+        """
+        self.url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.prefix = prefix
+
+        # Defer importing to avoid dependency if not using this backend
+        try:
+            import redis
+            self.client = redis.Redis.from_url(self.url, decode_responses=True)
+        except ImportError:
+            raise ImportError("Redis package is required for RedisBackend. Install with 'poetry add redis'.")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Optional time-to-live in seconds (None means no expiry)
+        """
+        # Redis rejects ex=0, so treat any falsy ttl as no expiry like FileBackend does
+        self.client.set(self.prefix + key, value, ex=ttl or None)
+
+
+class LLMCache:
+    """
+    Response cache in front of a pluggable storage backend.
+
+    The cache is only an optimization, so backend errors are reported as
+    warnings and treated as a miss (on get) or a skipped write (on set).
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: The storage backend to use
+            default_ttl: Time-to-live in seconds applied when set() is given none
+        """
+        self.backend = backend
+        self.default_ttl = default_ttl
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            warnings.warn(f"Summary cache lookup failed: {str(e)}")
+            return None
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: The cache key
+            value: The response to store
+            ttl: Optional time-to-live in seconds (defaults to default_ttl)
+        """
+        try:
+            self.backend.set(key, value, ttl if ttl is not None else self.default_ttl)
+        except Exception as e:
+            warnings.warn(f"Summary cache write failed: {str(e)}")
+
+
+def make_key(provider_name: str, model_name: str, max_length: Optional[int], text: str) -> str:
+    """
+    Build a deterministic cache key for a summarization request.
+
+    Args:
+        provider_name: The resolved provider name
+        model_name: The resolved model name
+        max_length: The requested maximum summary length
+        text: The text being summarized
+
+    Returns:
+        A hex SHA-256 digest identifying the request
+    """
+    # max_length goes in as a string: orjson rejects integers beyond 64 bits,
+    # and computing the key must never fail a summary
+    payload = _dumps({"p": provider_name, "m": model_name, "ml": str(max_length), "t": text})
+    return hashlib.sha256(payload).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache() -> Optional[LLMCache]:
+    """
+    Factory function to get the configured response cache.
+
+    Reads SUMMARY_CACHE ('file', 'redis' or 'none') and SUMMARY_CACHE_TTL.
+
+    Returns:
+        The shared LLMCache instance, or None if caching is disabled or the
+        backend could not be set up
+    """
+    backend_name = os.getenv("SUMMARY_CACHE", "file").lower()
+
+    if backend_name == "none":
+        return None
+
+    # The cache is only an optimization, so bad settings disable it rather
+    # than failing the summary
+    try:
+        ttl = os.getenv("SUMMARY_CACHE_TTL")
+        try:
+            default_ttl = int(ttl) if ttl else None
+        except ValueError:
+            default_ttl = 0
+        if default_ttl is not None and default_ttl < 1:
+            raise ValueError(f"SUMMARY_CACHE_TTL must be a positive number of seconds, got: {ttl}")
+
+        if backend_name == "file":
+            backend = FileBackend(os.getenv("SUMMARY_CACHE_DIR"))
+
+        elif backend_name == "redis":
+            backend = RedisBackend()
+
+        else:
+            raise ValueError(f"Unknown cache backend: {backend_name}")
+
+    except (OSError, ImportError, ValueError) as e:
+        warnings.warn(f"Summary cache disabled: {str(e)}")
+        return None
+
+    return LLMCache(backend, default_ttl=default_ttl)
@@ -2,13 +2,21 @@
 Command-line interface for the YouTube Summary tool.
 """
 
+import argparse
+import asyncio
+import functools
 import os
-import fire
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Dict, Iterator, Optional, Union
 
-from youtube_summary.transcript import get_transcript_text
-from youtube_summary.summarizer import summarize_text
+from youtube_summary.transcript import get_transcript_text, get_transcripts_async
+from youtube_summary.summarizer import is_english, summarize_text
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load the .env file once per process."""
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
 def summarize(
@@ -17,8 +25,9 @@ def summarize(
     model: Optional[str] = None,
     max_length: Optional[int] = None,
     languages: Optional[str] = None,
-    output_file: Optional[str] = None
-) -> str:
+    output_file: Optional[str] = None,
+    stream: bool = False
+) -> Optional[str]:
     """
     Fetch a YouTube video transcript and summarize it.
     
@@ -29,12 +38,13 @@ def summarize(
         max_length: Maximum word count for the summary
         languages: Comma-separated list of language codes to try (e.g., 'en,fr,es')
         output_file: Optional file path to save the summary
+        stream: Print the summary as it is generated instead of returning it
         
     Returns:
-        The summarized transcript
+        The summarized transcript, or None if it was streamed
     """
     # Load environment variables
-    load_dotenv()
+    _load_env()
     
     print(f"Fetching transcript for: {url}")
     
@@ -53,6 +63,18 @@ def summarize(
     if model:
         kwargs['model_name'] = model
     
+    # The library only returns one of the requested languages, so the
+    # transcript is known to be English when nothing else was requested
+    if all(is_english(lang) for lang in langs):
+        kwargs['language'] = 'en'
+    
+    if stream:
+        _stream_summary(
+            summarize_text(transcript, provider_name=provider, max_length=max_length, stream=True, **kwargs),
+            output_file
+        )
+        return None
+    
     summary = summarize_text(transcript, provider_name=provider, max_length=max_length, **kwargs)
     
     # Save to file if requested
@@ -64,6 +86,29 @@ def summarize(
     return summary
 
 
+def _stream_summary(pieces: Iterator[str], output_file: Optional[str] = None) -> None:
+    """
+    Print summary pieces as they arrive, optionally writing them to a file too.
+    
+    Args:
+        pieces: Iterator over pieces of the summary
+        output_file: Optional file path to save the summary
+    """
+    f = open(output_file, 'w', encoding='utf-8') if output_file else None
+    try:
+        for piece in pieces:
+            print(piece, end='', flush=True)
+            if f:
+                f.write(piece)
+        print()
+    finally:
+        if f:
+            f.close()
+    
+    if output_file:
+        print(f"Summary saved to {output_file}")
+
+
 def transcript(
     url: str,
     languages: Optional[str] = None,
@@ -81,7 +126,7 @@ def transcript(
         The transcript text
     """
     # Load environment variables
-    load_dotenv()
+    _load_env()
     
     print(f"Fetching transcript for: {url}")
     
@@ -103,12 +148,88 @@ def transcript(
     return transcript
 
 
+def transcript_batch(
+    urls: str,
+    languages: Optional[str] = None
+) -> Dict[str, Union[str, ValueError]]:
+    """
+    Fetch transcripts for several YouTube videos concurrently.
+    
+    Args:
+        urls: Comma-separated list of YouTube video URLs or video IDs
+        languages: Comma-separated list of language codes to try (e.g., 'en,fr,es')
+        
+    Returns:
+        A dict mapping each URL to its transcript text, or to the error
+        raised while fetching it
+    """
+    # Load environment variables
+    _load_env()
+    
+    url_list = [u.strip() for u in urls.split(',') if u.strip()]
+    print(f"Fetching transcripts for {len(url_list)} videos")
+    
+    # Parse languages
+    langs = ['en']
+    if languages:
+        langs = languages.split(',')
+    
+    # Get transcripts
+    transcripts = asyncio.run(get_transcripts_async(url_list, languages=langs))
+    fetched = [t for t in transcripts.values() if isinstance(t, str)]
+    print(f"Fetched {len(fetched)} of {len(transcripts)} transcripts ({sum(map(len, fetched))} characters)")
+    
+    return transcripts
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI."""
+    parser = argparse.ArgumentParser(
+        prog='youtube-summary',
+        description='Extract and summarize YouTube video transcripts.'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    summarize_parser = subparsers.add_parser('summarize', help='Fetch a video transcript and summarize it')
+    summarize_parser.add_argument('url', help='YouTube video URL or video ID')
+    summarize_parser.add_argument('--provider', help="LLM provider to use ('ollama', 'openai', 'anthropic')")
+    summarize_parser.add_argument('--model', help='Model name to use with the provider')
+    summarize_parser.add_argument('--max-length', '--max_length', type=int, help='Maximum word count for the summary')
+    summarize_parser.add_argument('--languages', help="Comma-separated list of language codes to try (e.g., 'en,fr,es')")
+    summarize_parser.add_argument('--output-file', '--output_file', help='Optional file path to save the summary')
+    summarize_parser.add_argument('--stream', action='store_true', help='Print the summary as it is generated')
+    
+    transcript_parser = subparsers.add_parser('transcript', help='Fetch a video transcript without summarizing')
+    transcript_parser.add_argument('url', help='YouTube video URL or video ID')
+    transcript_parser.add_argument('--languages', help="Comma-separated list of language codes to try (e.g., 'en,fr,es')")
+    transcript_parser.add_argument('--output-file', '--output_file', help='Optional file path to save the transcript')
+    
+    batch_parser = subparsers.add_parser('transcript_batch', help='Fetch transcripts for several videos concurrently')
+    batch_parser.add_argument('urls', help='Comma-separated list of YouTube video URLs or video IDs')
+    batch_parser.add_argument('--languages', help="Comma-separated list of language codes to try (e.g., 'en,fr,es')")
+    
+    return parser
+
+
 def main():
     """Entry point for the CLI."""
-    fire.Fire({
-        'summarize': summarize,
-        'transcript': transcript
-    })
+    args = vars(_build_parser().parse_args())
+    command = args.pop('command')
+    
+    if command == 'summarize':
+        summary = summarize(**args)
+        if summary is not None:
+            print(summary)
+    
+    elif command == 'transcript':
+        print(transcript(**args))
+    
+    elif command == 'transcript_batch':
+        for url, text in transcript_batch(**args).items():
+            if isinstance(text, ValueError):
+                print(f"{url}: Error: {text}")
+            else:
+                print(f"{url}: {text}")
 
 
 if __name__ == "__main__":
@@ -2,10 +2,75 @@
 Module for summarizing text using various LLM providers.
 """
 
+import atexit
+import functools
+import math
 import os
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Any
-import ollama
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Union
+
+from youtube_summary.cache import LLMCache, get_cache, make_key
+
+
+# Rough English words-per-token ratio used to size transcript chunks
+_WORDS_PER_TOKEN = 0.75
+
+# Caption sound tags carry no meaning for a summary in any language
+_CAPTION_TAG_RE = re.compile(r'\[(?:music|applause|laughter|inaudible)\]', re.I)
+# English hesitation words; only safe to strip from English text ("um" is a
+# real word in German and Portuguese). Ambiguous fillers like "like" or
+# "you know" are kept since they are often real content. Hyphens count as
+# part of the word so interjections like "uh-huh" are left alone.
+_FILLER_RE = re.compile(r'(?<![\w-])(?:uh|um|erm|uhm|hmm)(?![\w-]),?', re.I)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def is_english(language: Optional[str]) -> bool:
+    """
+    Check whether a language code refers to English.
+    
+    Args:
+        language: A language code such as 'en' or 'en-US'
+        
+    Returns:
+        True if the code is English, False otherwise (including when it is None)
+    """
+    return bool(language) and language.split('-')[0].lower() == 'en'
+
+
+def _compress_transcript(text: str, language: Optional[str] = None) -> str:
+    """
+    Strip filler words and caption artifacts to cut the tokens sent to the LLM.
+    
+    Args:
+        text: The transcript text
+        language: Language code of the text; hesitation words are only
+            stripped when this is English
+        
+    Returns:
+        The transcript with fillers removed and whitespace collapsed
+    """
+    text = _CAPTION_TAG_RE.sub('', text)
+    if is_english(language):
+        text = _FILLER_RE.sub('', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _length_instruction(max_length: Optional[int]) -> str:
+    """
+    Build the summary length clause placed before the transcript in prompts.
+    
+    Args:
+        max_length: Optional maximum length for the summary
+        
+    Returns:
+        The clause (with a leading space), or an empty string if no limit is set
+    """
+    if max_length:
+        return f" Keep the summary under {max_length} words."
+    return ""
 
 
 class LLMProvider(ABC):
@@ -24,6 +89,21 @@ class LLMProvider(ABC):
             The summarized text
         """
         pass
+    
+    def stream(self, text: str, max_length: Optional[int] = None) -> Iterator[str]:
+        """
+        Summarize the given text, yielding the summary as it is generated.
+        
+        Providers that can't stream yield the whole summary at once.
+        
+        Args:
+            text: The text to summarize
+            max_length: Optional maximum length for the summary
+            
+        Yields:
+            Pieces of the summary in the order they are produced
+        """
+        yield self.summarize(text, max_length)
 
 
 class OllamaProvider(LLMProvider):
@@ -37,6 +117,13 @@ class OllamaProvider(LLMProvider):
             model_name: The name of the Ollama model to use
         """
         self.model_name = model_name
+        
+        # Defer importing so commands that never summarize don't pay for it
+        try:
+            import ollama
+            self._ollama = ollama
+        except ImportError:
+            raise ImportError("Ollama package is required for OllamaProvider. Install with 'poetry add ollama'.")
     
     def summarize(self, text: str, max_length: Optional[int] = None) -> str:
         """
@@ -49,29 +136,42 @@ class OllamaProvider(LLMProvider):
         Returns:
             The summarized text
         """
-        # Prepare the prompt
+        return ''.join(self.stream(text, max_length)).strip()
+    
+    def stream(self, text: str, max_length: Optional[int] = None) -> Iterator[str]:
+        """
+        Summarize the given text using a local Ollama model, streaming the response.
+        
+        Args:
+            text: The text to summarize
+            max_length: Optional maximum length for the summary
+            
+        Yields:
+            Pieces of the summary in the order they are produced
+        """
+        # Keep everything before the transcript stable so Ollama can reuse the
+        # KV cache for the shared prefix; only the transcript varies per call
         prompt = f"""Please provide a concise summary of the following transcript.
-Focus on the main points and key insights.
+Focus on the main points and key insights.{_length_instruction(max_length)}
 
 TRANSCRIPT:
 {text}
 
 SUMMARY:"""
-
-        if max_length:
-            prompt += f"\n(Please keep the summary under {max_length} words)"
         
         # Generate the summary
-        response = ollama.generate(
+        response = self._ollama.generate(
             model=self.model_name,
             prompt=prompt,
             options={
                 "temperature": 0.3,
                 "num_predict": 1000,
-            }
+            },
+            stream=True
         )
         
-        return response['response'].strip()
+        for chunk in response:
+            yield chunk['response']
 
 
 class OpenAIProvider(LLMProvider):
@@ -109,13 +209,25 @@ class OpenAIProvider(LLMProvider):
         Returns:
             The summarized text
         """
-        # Prepare the system message
-        system_message = "You are a helpful assistant that summarizes transcripts concisely."
+        return ''.join(self.stream(text, max_length)).strip()
+    
+    def stream(self, text: str, max_length: Optional[int] = None) -> Iterator[str]:
+        """
+        Summarize the given text using OpenAI's API, streaming the response.
+        
+        Args:
+            text: The text to summarize
+            max_length: Optional maximum length for the summary
+            
+        Yields:
+            Pieces of the summary in the order they are produced
+        """
+        # Prepare the system message; the length limit lives here so the
+        # user message is a fixed prefix followed only by the transcript
+        system_message = f"You are a helpful assistant that summarizes transcripts concisely.{_length_instruction(max_length)}"
         
         # Prepare the user message
         user_message = f"Please summarize the following transcript:\n\n{text}"
-        if max_length:
-            user_message += f"\n\nKeep the summary under {max_length} words."
         
         # Generate the summary
         response = self.client.chat.completions.create(
@@ -125,10 +237,13 @@ class OpenAIProvider(LLMProvider):
                 {"role": "user", "content": user_message}
             ],
             temperature=0.3,
-            max_tokens=1000
+            max_tokens=1000,
+            stream=True
         )
         
-        return response.choices[0].message.content.strip()
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
 
 class AnthropicProvider(LLMProvider):
@@ -166,15 +281,26 @@ class AnthropicProvider(LLMProvider):
         Returns:
             The summarized text
         """
+        return ''.join(self.stream(text, max_length)).strip()
+    
+    def stream(self, text: str, max_length: Optional[int] = None) -> Iterator[str]:
+        """
+        Summarize the given text using Anthropic's API, streaming the response.
+        
+        Args:
+            text: The text to summarize
+            max_length: Optional maximum length for the summary
+            
+        Yields:
+            Pieces of the summary in the order they are produced
+        """
         # Prepare the prompt
-        system_message = "Summarize the provided transcript concisely, focusing on key points and insights."
+        system_message = f"Summarize the provided transcript concisely, focusing on key points and insights.{_length_instruction(max_length)}"
         
         user_message = f"Here is the transcript to summarize:\n\n{text}"
-        if max_length:
-            user_message += f"\n\nKeep the summary under {max_length} words."
         
         # Generate the summary
-        response = self.client.messages.create(
+        with self.client.messages.stream(
             model=self.model_name,
             system=system_message,
             max_tokens=1000,
@@ -182,15 +308,46 @@ class AnthropicProvider(LLMProvider):
             messages=[
                 {"role": "user", "content": user_message}
             ]
-        )
+        ) as response:
+            yield from response.text_stream
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_provider(provider_name: str, model_name: str, api_key: Optional[str]) -> LLMProvider:
+    """
+    Construct a provider once per (provider, model, API key) and reuse it.
+    
+    Reusing the instance keeps the underlying client and its HTTP connection
+    pool alive across calls.
+    
+    Args:
+        provider_name: The resolved provider name
+        model_name: The resolved model name
+        api_key: The resolved API key (None for providers that don't need one)
         
-        return response.content[0].text.strip()
+    Returns:
+        An instance of the requested LLM provider
+    """
+    if provider_name == "ollama":
+        return OllamaProvider(model_name=model_name)
+    
+    elif provider_name == "openai":
+        return OpenAIProvider(model_name=model_name, api_key=api_key)
+    
+    elif provider_name == "anthropic":
+        return AnthropicProvider(model_name=model_name, api_key=api_key)
+    
+    else:
+        raise ValueError(f"Unknown provider: {provider_name}")
 
 
 def get_provider(provider_name: str = None, **kwargs) -> LLMProvider:
     """
     Factory function to get the appropriate LLM provider.
     
+    Providers are cached, so repeated calls with the same settings return the
+    same instance.
+    
     Args:
         provider_name: The name of the provider to use (defaults to SUMMARY_PROVIDER env var or 'ollama')
         **kwargs: Additional arguments to pass to the provider constructor
@@ -202,34 +359,328 @@ def get_provider(provider_name: str = None, **kwargs) -> LLMProvider:
     
     if provider_name == "ollama":
         model_name = kwargs.get("model_name") or os.getenv("OLLAMA_MODEL", "llama3.2")
-        return OllamaProvider(model_name=model_name)
+        api_key = None
     
     elif provider_name == "openai":
         model_name = kwargs.get("model_name") or os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
         api_key = kwargs.get("api_key") or os.getenv("OPENAI_API_KEY")
-        return OpenAIProvider(model_name=model_name, api_key=api_key)
     
     elif provider_name == "anthropic":
         model_name = kwargs.get("model_name") or os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
         api_key = kwargs.get("api_key") or os.getenv("ANTHROPIC_API_KEY")
-        return AnthropicProvider(model_name=model_name, api_key=api_key)
     
     else:
         raise ValueError(f"Unknown provider: {provider_name}")
+    
+    return _cached_provider(provider_name, model_name, api_key)
 
 
-def summarize_text(text: str, provider_name: str = None, max_length: Optional[int] = None, **kwargs) -> str:
+@functools.cache
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared pool for chunk-level provider calls.
+    
+    Built on first use rather than at import so YS_CONCURRENCY can come from
+    the .env file, and so a bad value only affects summarization.
+    
+    Returns:
+        The shared executor, sized to stay within provider rate limits
+        
+    Raises:
+        ValueError: If YS_CONCURRENCY is not a positive integer
+    """
+    value = os.getenv("YS_CONCURRENCY", "8")
+    try:
+        max_workers = int(value)
+    except ValueError:
+        max_workers = 0
+    if max_workers < 1:
+        raise ValueError(f"YS_CONCURRENCY must be a positive integer, got: {value}")
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    atexit.register(executor.shutdown)
+    return executor
+
+
+def _get_chunk_tokens() -> int:
+    """
+    Get the chunk size used to split long transcripts.
+    
+    Returns:
+        The approximate chunk size in tokens, from SUMMARY_CHUNK_TOKENS
+        
+    Raises:
+        ValueError: If SUMMARY_CHUNK_TOKENS is not a positive integer
+    """
+    value = os.getenv("SUMMARY_CHUNK_TOKENS", "3000")
+    try:
+        chunk_tokens = int(value)
+    except ValueError:
+        chunk_tokens = 0
+    if chunk_tokens < 1:
+        raise ValueError(f"SUMMARY_CHUNK_TOKENS must be a positive integer, got: {value}")
+    
+    return chunk_tokens
+
+
+def _chunk_text(text: str, chunk_tokens: int = 3000, overlap: int = 200) -> List[str]:
+    """
+    Split text into overlapping chunks of roughly chunk_tokens tokens.
+    
+    Token counts are estimated from word counts (about 0.75 words per token),
+    which is close enough for English transcripts across all providers. Words
+    are spread evenly over the fewest chunks that fit, so no chunk ends up
+    as mostly overlap with its neighbour.
+    
+    Args:
+        text: The text to split
+        chunk_tokens: Approximate size of each chunk in tokens
+        overlap: Approximate number of tokens shared by consecutive chunks
+            (at most a quarter of a chunk)
+        
+    Returns:
+        The list of chunks (a single chunk if the text is short enough)
+    """
+    words = text.split()
+    chunk_words = max(1, int(chunk_tokens * _WORDS_PER_TOKEN))
+    # Cap the overlap so most of every chunk is new text, even for small chunks
+    overlap_words = min(int(overlap * _WORDS_PER_TOKEN), chunk_words // 4)
+    
+    if len(words) <= chunk_words:
+        return [text]
+    
+    # Each chunk contributes its share of new words plus `overlap_words` shared with the next
+    new_words = len(words) - overlap_words
+    count = math.ceil(new_words / (chunk_words - overlap_words))
+    bounds = [i * new_words // count for i in range(count + 1)]
+    return [
+        ' '.join(words[bounds[i]:bounds[i + 1] + overlap_words])
+        for i in range(count)
+    ]
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text from its word count.
+    
+    Args:
+        text: The text to measure
+        
+    Returns:
+        The approximate number of tokens
+    """
+    return int(len(text.split()) / _WORDS_PER_TOKEN)
+
+
+def _condense(
+    provider: LLMProvider,
+    summaries: List[str],
+    budget: int,
+    keep_first: int = 1,
+    window: int = 10
+) -> List[str]:
+    """
+    Keep the chunk summaries passed to the reduce step near a token budget.
+    
+    Summaries that already fit are returned unchanged. Otherwise the opening
+    summaries (which usually set up the topic) and up to `window` of the most
+    recent ones are kept as they are, and everything in between is summarized
+    again into a single entry so that part of the video still reaches the
+    final summary. The window shrinks until the kept summaries leave room for
+    that entry, which is assumed to be about as long as the longest summary.
+    
+    The middle is condensed in a single pass (its chunks in parallel, then
+    one call over their summaries) rather than recursively, so the number of
+    provider calls stays bounded. The budget is therefore only approximate:
+    a condensed entry longer than expected is passed on as it is.
+    
+    Args:
+        provider: The provider to condense the middle summaries with
+        summaries: Chunk summaries in transcript order
+        budget: Approximate token budget for the joined summaries
+        keep_first: Number of leading summaries to always keep
+        window: Maximum number of trailing summaries to keep
+        
+    Returns:
+        The condensed list of summaries
+    """
+    head, rest = summaries[:keep_first], summaries[keep_first:]
+    if not rest or _estimate_tokens('\n\n'.join(summaries)) <= budget:
+        return summaries
+    
+    reserve = max(_estimate_tokens(s) for s in rest)
+    window = min(window, len(rest) - 1)
+    while window > 0 and _estimate_tokens('\n\n'.join(head + rest[-window:])) + reserve > budget:
+        window -= 1
+    
+    middle, tail = rest[:len(rest) - window], rest[len(rest) - window:]
+    if len(middle) == 1:
+        condensed = middle[0]
+    else:
+        chunks = _chunk_text('\n\n'.join(middle), chunk_tokens=budget)
+        if len(chunks) > 1:
+            chunks = list(_get_executor().map(provider.summarize, chunks))
+        condensed = provider.summarize('\n\n'.join(chunks))
+    return head + [condensed] + tail
+
+
+def _map_chunks(provider: LLMProvider, text: str) -> str:
+    """
+    Condense long text by summarizing its chunks in parallel.
+    
+    Text that fits in one chunk is returned unchanged; otherwise the chunk
+    summaries are joined and returned for the final (reduce) summarization.
+    
+    Args:
+        provider: The provider to summarize chunks with
+        text: The text to summarize
+        
+    Returns:
+        The text to pass to the final summarization call
+    """
+    chunk_tokens = _get_chunk_tokens()
+    chunks = _chunk_text(text, chunk_tokens=chunk_tokens)
+    if len(chunks) == 1:
+        return text
+    
+    summaries = list(_get_executor().map(provider.summarize, chunks))
+    
+    # The reduce input is held to roughly the same budget as a single chunk
+    return '\n\n'.join(_condense(provider, summaries, budget=chunk_tokens))
+
+
+def _stream_map_reduce(provider: LLMProvider, text: str, max_length: Optional[int]) -> Iterator[str]:
+    """
+    Summarize text with map-reduce, streaming the final summary.
+    
+    Args:
+        provider: The provider to summarize with
+        text: The text to summarize
+        max_length: Optional maximum length for the summary
+        
+    Yields:
+        Pieces of the summary in the order they are produced
+    """
+    yield from _strip_stream(provider.stream(_map_chunks(provider, text), max_length))
+
+
+def _strip_stream(pieces: Iterator[str]) -> Iterator[str]:
+    """
+    Strip leading and trailing whitespace from a streamed summary.
+    
+    The pieces joined together match what summarize() returns, so streamed
+    output looks the same as a summary replayed from the cache. Whitespace is
+    held back until more text follows it, so trailing whitespace is dropped.
+    
+    Args:
+        pieces: Pieces of the summary in the order they are produced
+        
+    Yields:
+        The pieces with the surrounding whitespace removed
+    """
+    pending = ''
+    started = False
+    for piece in pieces:
+        if not started:
+            piece = piece.lstrip()
+            if not piece:
+                continue
+            started = True
+        
+        stripped = piece.rstrip()
+        if stripped:
+            yield pending + stripped
+            pending = piece[len(stripped):]
+        else:
+            pending += piece
+
+
+def summarize_text(
+    text: str,
+    provider_name: str = None,
+    max_length: Optional[int] = None,
+    use_cache: bool = True,
+    stream: bool = False,
+    compress: bool = True,
+    language: Optional[str] = None,
+    **kwargs
+) -> Union[str, Iterator[str]]:
     """
     Summarize the given text using the specified provider.
     
+    Text longer than SUMMARY_CHUNK_TOKENS is split into chunks that are
+    summarized in parallel before a final pass summarizes the summaries.
+    Identical requests (same provider, model, max_length and text) are served
+    from the response cache configured by SUMMARY_CACHE.
+    
     Args:
         text: The text to summarize
         provider_name: The name of the provider to use
         max_length: Optional maximum length for the summary
+        use_cache: Whether to read from and write to the response cache
+        stream: Return an iterator yielding the summary as it is generated
+        compress: Strip caption tags (and, for English, filler words) before summarizing
+        language: Language code of the text, if known; filler words are only
+            stripped for English
         **kwargs: Additional arguments to pass to the provider
         
     Returns:
-        The summarized text
+        The summarized text, or an iterator over its pieces if stream is True
     """
+    provider_name = provider_name or os.getenv("SUMMARY_PROVIDER", "ollama").lower()
     provider = get_provider(provider_name, **kwargs)
-    return provider.summarize(text, max_length)
+    
+    if compress:
+        text = _compress_transcript(text, language)
+    
+    cache = get_cache() if use_cache else None
+    if cache is None:
+        if stream:
+            return _stream_map_reduce(provider, text, max_length)
+        return provider.summarize(_map_chunks(provider, text), max_length)
+    
+    key = make_key(provider_name, provider.model_name, max_length, text)
+    summary = cache.get(key)
+    if stream:
+        return _stream_cached(provider, text, max_length, cache, key, summary)
+    
+    if summary is None:
+        summary = provider.summarize(_map_chunks(provider, text), max_length)
+        cache.set(key, summary)
+    
+    return summary
+
+
+def _stream_cached(
+    provider: LLMProvider,
+    text: str,
+    max_length: Optional[int],
+    cache: LLMCache,
+    key: str,
+    summary: Optional[str]
+) -> Iterator[str]:
+    """
+    Stream a summary, replaying a cache hit or caching the result of a miss.
+    
+    Args:
+        provider: The provider to stream from on a cache miss
+        text: The text to summarize
+        max_length: Optional maximum length for the summary
+        cache: The response cache
+        key: The cache key for this request
+        summary: The cached summary, or None on a miss
+        
+    Yields:
+        Pieces of the summary in the order they are produced
+    """
+    if summary is not None:
+        yield summary
+        return
+    
+    pieces = []
+    for piece in _stream_map_reduce(provider, text, max_length):
+        pieces.append(piece)
+        yield piece
+    
+    # Only reached if the stream was fully consumed, so partial output is never cached
+    cache.set(key, ''.join(pieces))
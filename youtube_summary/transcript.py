@@ -2,17 +2,50 @@
 Module for extracting transcripts from YouTube videos.
 """
 
+import asyncio
 import re
+import string
+from operator import itemgetter
 from typing import Dict, List, Optional, Union
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from youtube_transcript_api import YouTubeTranscriptApi
 
 
+# Match patterns like:
+# - https://www.youtube.com/watch?v=VIDEO_ID
+# - https://youtu.be/VIDEO_ID
+# - https://youtube.com/watch?v=VIDEO_ID
+# - https://www.youtube.com/watch?v=VIDEO_ID&feature=share
+# - https://www.youtube.com/shorts/VIDEO_ID
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/|youtube\.com/\?v=|youtube\.com/shorts/)([^&\n?#]+)'
+)
+_VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+
+_TEXT = itemgetter('text')
+
+# Shared HTTP session so repeated and concurrent fetches reuse keep-alive
+# connections instead of paying a fresh TCP+TLS handshake per request
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+_API = YouTubeTranscriptApi(http_client=_SESSION)
+
+
 def extract_video_id(url: str) -> str:
     """
     Extract the video ID from a YouTube URL.
     
     Args:
-        url: The YouTube URL to extract the ID from
+        url: The YouTube URL (or bare video ID) to extract the ID from
         
     Returns:
         The extracted video ID
@@ -20,24 +53,47 @@ def extract_video_id(url: str) -> str:
     Raises:
         ValueError: If the URL is not a valid YouTube URL
     """
-    # Match patterns like:
-    # - https://www.youtube.com/watch?v=VIDEO_ID
-    # - https://youtu.be/VIDEO_ID
-    # - https://youtube.com/watch?v=VIDEO_ID
-    # - https://www.youtube.com/watch?v=VIDEO_ID&feature=share
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/|youtube\.com/\?v=)([^&\n?#]+)',
-        r'youtube\.com/shorts/([^&\n?#]+)',
-    ]
+    # Bare video IDs need no regex at all
+    if len(url) == 11 and _VIDEO_ID_CHARS.issuperset(url):
+        return url
     
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
     
     raise ValueError(f"Could not extract video ID from URL: {url}")
 
 
+def _resolve_video_id(video_id_or_url: str) -> str:
+    """
+    Resolve a YouTube URL or bare video ID to a video ID.
+    
+    Args:
+        video_id_or_url: Either a YouTube video ID or URL
+        
+    Returns:
+        The video ID
+    """
+    # Check if it's a URL or a video ID
+    if 'youtube.com' in video_id_or_url or 'youtu.be' in video_id_or_url:
+        return extract_video_id(video_id_or_url)
+    return video_id_or_url
+
+
+def _fetch_segments(video_id: str, languages: List[str]) -> List[Dict[str, Union[str, float]]]:
+    """
+    Fetch the raw transcript segments for a video over the shared session.
+    
+    Args:
+        video_id: The YouTube video ID
+        languages: List of language codes to try, in order of preference
+        
+    Returns:
+        A list of transcript segments, each containing 'text', 'start', and 'duration' keys
+    """
+    return _API.fetch(video_id, languages=languages).to_raw_data()
+
+
 def get_transcript(video_id_or_url: str, languages: List[str] = ['en']) -> List[Dict[str, Union[str, float]]]:
     """
     Get the transcript for a YouTube video.
@@ -52,14 +108,10 @@ def get_transcript(video_id_or_url: str, languages: List[str] = ['en']) -> List[
     Raises:
         ValueError: If the transcript could not be retrieved
     """
-    # Check if it's a URL or a video ID
-    if 'youtube.com' in video_id_or_url or 'youtu.be' in video_id_or_url:
-        video_id = extract_video_id(video_id_or_url)
-    else:
-        video_id = video_id_or_url
+    video_id = _resolve_video_id(video_id_or_url)
     
     try:
-        transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
+        transcript = _fetch_segments(video_id, languages)
         return transcript
     except Exception as e:
         raise ValueError(f"Could not retrieve transcript: {str(e)}")
@@ -80,4 +132,65 @@ def get_transcript_text(video_id_or_url: str, languages: List[str] = ['en']) ->
         ValueError: If the transcript could not be retrieved
     """
     transcript_segments = get_transcript(video_id_or_url, languages)
-    return ' '.join([segment['text'] for segment in transcript_segments])
+    return ' '.join(map(_TEXT, transcript_segments))
+
+
+async def _fetch_one(video_id: str, languages: List[str]) -> List[Dict[str, Union[str, float]]]:
+    """
+    Fetch a single transcript in a worker thread so it doesn't block the event loop.
+    
+    Args:
+        video_id: The YouTube video ID
+        languages: List of language codes to try, in order of preference
+        
+    Returns:
+        A list of transcript segments
+        
+    Raises:
+        ValueError: If the transcript could not be retrieved
+    """
+    try:
+        return await asyncio.to_thread(_fetch_segments, video_id, languages)
+    except Exception as e:
+        raise ValueError(f"Could not retrieve transcript for {video_id}: {str(e)}")
+
+
+async def get_transcripts_async(
+    urls: List[str],
+    languages: List[str] = ['en']
+) -> Dict[str, Union[str, ValueError]]:
+    """
+    Get the transcripts for several YouTube videos concurrently.
+    
+    A video whose transcript can't be fetched doesn't fail the batch; its
+    error is returned in place of the transcript.
+    
+    Args:
+        urls: YouTube video IDs or URLs
+        languages: List of language codes to try, in order of preference
+        
+    Returns:
+        A dict mapping each input URL to its transcript as a single string,
+        or to the ValueError raised while fetching it
+        
+    Raises:
+        ValueError: If a URL is invalid
+    """
+    # Resolve IDs up front so a bad URL fails before any request is sent
+    video_ids = [_resolve_video_id(url) for url in urls]
+    
+    results = await asyncio.gather(
+        *(_fetch_one(video_id, languages) for video_id in video_ids),
+        return_exceptions=True
+    )
+    
+    transcripts = {}
+    for url, result in zip(urls, results):
+        if isinstance(result, ValueError):
+            transcripts[url] = result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            transcripts[url] = ' '.join(map(_TEXT, result))
+    
+    return transcripts